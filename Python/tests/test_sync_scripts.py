@@ -6,6 +6,8 @@ Tests the functionality of both Python and shell script versions.
 
 import unittest
 import tempfile
+import shutil
+import io
 import os
 import json
 import yaml
@@ -17,25 +19,31 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
 
 try:
-    from gitea_github_sync import GitRepoSyncer
+    from gitea_github_sync import GitRepoSyncer, main
 except ImportError:
     # Handle case where dependencies aren't installed
     GitRepoSyncer = None
 
+try:
+    from pyfakefs.fake_filesystem_unittest import TestCase as FakeFilesystemTestCase
+except ImportError:
+    # Fall back to real temporary directories
+    FakeFilesystemTestCase = None
 
-class TestGiteaGithubSync(unittest.TestCase):
-    """Test cases for the Gitea-GitHub sync functionality."""
+
+class TestGiteaGithubSync(FakeFilesystemTestCase or unittest.TestCase):
+    """Test cases for the Python sync script, isolated from disk and subprocesses."""
     
     def setUp(self):
-        """Set up test environment."""
-        self.test_dir = tempfile.mkdtemp()
+        """Set up test environment on an in-memory filesystem when possible."""
+        if FakeFilesystemTestCase is not None:
+            self.setUpPyfakefs()
+            self.test_dir = '/sync-test'
+            os.makedirs(self.test_dir)
+        else:
+            self.test_dir = tempfile.mkdtemp()
+            self.addCleanup(shutil.rmtree, self.test_dir, ignore_errors=True)
         self.config_file = os.path.join(self.test_dir, 'test_config.yaml')
-        self.shell_config_file = os.path.join(self.test_dir, 'test_config.json')
-    
-    def tearDown(self):
-        """Clean up test environment."""
-        import shutil
-        shutil.rmtree(self.test_dir, ignore_errors=True)
     
     def test_config_template_creation_yaml(self):
         """Test YAML configuration template creation."""
@@ -59,72 +67,17 @@ class TestGiteaGithubSync(unittest.TestCase):
         self.assertIn('repositories', config)
         self.assertIn('sync_settings', config)
     
-    def test_shell_script_config_creation(self):
-        """Test shell script configuration template creation."""
-        script_path = os.path.join(os.path.dirname(__file__), '..', 'scripts', 'gitea-github-sync.sh')
-        
-        if not os.path.exists(script_path):
-            self.skipTest("Shell script not available")
-        
-        # Test that the script can create a config template
-        result = subprocess.run(
-            [script_path, '--init'],
-            cwd=self.test_dir,
-            capture_output=True,
-            text=True
-        )
-        
-        # Should exit with 0 when creating config
-        self.assertEqual(result.returncode, 0)
-        
-        # Check that config file was created
-        config_file = os.path.join(self.test_dir, 'sync_config.json')
-        self.assertTrue(os.path.exists(config_file))
-        
-        # Verify config file is valid JSON
-        with open(config_file, 'r') as f:
-            config = json.load(f)
-        
-        # Check required sections exist
-        self.assertIn('gitea', config)
-        self.assertIn('github', config)
-        self.assertIn('repositories', config)
-        self.assertIn('sync_settings', config)
-    
-    def test_shell_script_help(self):
-        """Test that shell script shows help correctly."""
-        script_path = os.path.join(os.path.dirname(__file__), '..', 'scripts', 'gitea-github-sync.sh')
-        
-        if not os.path.exists(script_path):
-            self.skipTest("Shell script not available")
-        
-        # Test help flag
-        result = subprocess.run(
-            [script_path, '--help'],
-            capture_output=True,
-            text=True
-        )
-        
-        self.assertEqual(result.returncode, 0)
-        self.assertIn('Bidirectional sync script', result.stdout)
-        self.assertIn('Usage:', result.stdout)
-    
+    @unittest.skipIf(GitRepoSyncer is None, "GitRepoSyncer not available")
     def test_python_script_help(self):
         """Test that Python script shows help correctly."""
-        script_path = os.path.join(os.path.dirname(__file__), '..', 'scripts', 'gitea_github_sync.py')
+        # Call main() in-process instead of spawning a new interpreter
+        with patch.object(sys, 'argv', ['gitea_github_sync.py', '--help']), \
+             patch('sys.stdout', new_callable=io.StringIO) as stdout, \
+             self.assertRaises(SystemExit) as exit_context:
+            main()
         
-        if not os.path.exists(script_path):
-            self.skipTest("Python script not available")
-        
-        # Test help flag
-        result = subprocess.run(
-            [sys.executable, script_path, '--help'],
-            capture_output=True,
-            text=True
-        )
-        
-        self.assertEqual(result.returncode, 0)
-        self.assertIn('Bidirectional sync between Gitea and GitHub', result.stdout)
+        self.assertEqual(exit_context.exception.code, 0)
+        self.assertIn('Bidirectional sync between Gitea and GitHub', stdout.getvalue())
     
     @unittest.skipIf(GitRepoSyncer is None, "GitRepoSyncer not available")
     def test_config_validation(self):
@@ -160,6 +113,266 @@ class TestGiteaGithubSync(unittest.TestCase):
         self.assertIsNotNone(syncer)
         self.assertEqual(syncer.config['gitea']['url'], 'https://gitea.example.com')
     
+    def _create_syncer(self, repositories=None):
+        """Create a syncer from a minimal valid configuration."""
+        config = {
+            'gitea': {
+                'url': 'https://gitea.example.com',
+                'username': 'testuser',
+                'token': 'testtoken'
+            },
+            'github': {
+                'username': 'testuser',
+                'token': 'testtoken'
+            },
+            'repositories': repositories or [],
+            'sync_settings': {
+                'dry_run': True
+            }
+        }
+        
+        with open(self.config_file, 'w') as f:
+            yaml.dump(config, f)
+        
+        return GitRepoSyncer(self.config_file)
+    
+    @unittest.skipIf(GitRepoSyncer is None, "GitRepoSyncer not available")
+    def test_sync_all_repositories_runs_every_repo(self):
+        """Test that one failing repository does not stop the others."""
+        repositories = [
+            {'gitea_repo': f'test/repo{i}', 'github_repo': f'test/repo{i}'}
+            for i in range(3)
+        ]
+        syncer = self._create_syncer(repositories)
+        
+        with patch.object(syncer, 'sync_repository_code',
+                          side_effect=lambda repo: repo['gitea_repo'] != 'test/repo1') as mock_code, \
+             patch.object(syncer, 'sync_issues', return_value=True):
+            self.assertFalse(syncer.sync_all_repositories())
+        
+        synced = sorted(call.args[0]['gitea_repo'] for call in mock_code.call_args_list)
+        self.assertEqual(synced, ['test/repo0', 'test/repo1', 'test/repo2'])
+    
+    @unittest.skipIf(GitRepoSyncer is None, "GitRepoSyncer not available")
+    def test_github_issues_fetch_all_pages(self):
+        """Test that issue listings follow the Link header to the last page."""
+        syncer = self._create_syncer()
+        url = 'https://api.github.com/repos/test/repo/issues'
+        
+        def fake_get(request_url, params=None):
+            page = params['page']
+            response = MagicMock()
+            response.headers = {}
+            response.json.return_value = [{'number': page}]
+            response.content = json.dumps(response.json.return_value).encode()
+            response.links = {'last': {'url': f'{url}?per_page=100&page=3'}} if page == 1 else {}
+            return response
+        
+        with patch.object(syncer.github_session, 'get', side_effect=fake_get) as mock_get:
+            issues = syncer._get_github_issues('test/repo')
+        
+        self.assertEqual([issue['number'] for issue in issues], [1, 2, 3])
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(mock_get.call_args_list[0].kwargs['params'], {'per_page': 100, 'state': 'all', 'page': 1})
+    
+    @unittest.skipIf(GitRepoSyncer is None, "GitRepoSyncer not available")
+    def test_unchanged_repository_is_skipped(self):
+        """Test that a 304 from both APIs skips the git fetch and pushes."""
+        syncer = self._create_syncer()
+        syncer.workspace = self.test_dir
+        os.makedirs(os.path.join(self.test_dir, 'test_repo'))
+        open(os.path.join(self.test_dir, 'test_repo', 'HEAD'), 'w').close()
+        syncer._etag_cache = {
+            'test/repo->test/repo:gitea': {'etag': '"a"', 'body': {'name': 'repo'}},
+            'test/repo->test/repo:github': {'etag': '"b"', 'body': {'name': 'repo'}}
+        }
+        not_modified = MagicMock(status_code=304, headers={})
+        
+        with patch.object(syncer.gitea_session, 'get', return_value=not_modified) as gitea_get, \
+             patch.object(syncer.github_session, 'get', return_value=not_modified), \
+             patch.object(syncer, '_clone_or_update_repo') as mock_clone:
+            self.assertTrue(syncer.sync_repository_code(
+                {'gitea_repo': 'test/repo', 'github_repo': 'test/repo'}
+            ))
+        
+        mock_clone.assert_not_called()
+        self.assertEqual(gitea_get.call_args.kwargs['headers'], {'If-None-Match': '"a"'})
+    
+    @unittest.skipIf(GitRepoSyncer is None, "GitRepoSyncer not available")
+    def test_missing_mirror_is_cloned_despite_unchanged_apis(self):
+        """Test that a 304 from both APIs still clones and pushes a missing mirror."""
+        syncer = self._create_syncer()
+        syncer.workspace = self.test_dir
+        syncer._etag_cache = {
+            'test/repo->test/repo:gitea': {'etag': '"a"', 'body': {'name': 'repo'}},
+            'test/repo->test/repo:github': {'etag': '"b"', 'body': {'name': 'repo'}}
+        }
+        not_modified = MagicMock(status_code=304, headers={})
+        
+        with patch.object(syncer.gitea_session, 'get', return_value=not_modified), \
+             patch.object(syncer.github_session, 'get', return_value=not_modified), \
+             patch.object(syncer, '_clone_or_update_repo', return_value=True) as mock_clone, \
+             patch.object(syncer, '_push_mirror', return_value=True) as mock_push:
+            self.assertTrue(syncer.sync_repository_code(
+                {'gitea_repo': 'test/repo', 'github_repo': 'test/repo'}
+            ))
+        
+        self.assertEqual(mock_clone.call_count, 1)
+        self.assertEqual(mock_push.call_count, 1)
+        self.assertEqual(mock_clone.call_args.args[1], os.path.join(self.test_dir, 'test_repo'))
+    
+    @unittest.skipIf(GitRepoSyncer is None, "GitRepoSyncer not available")
+    def test_shared_gitea_change_reaches_every_pair(self):
+        """Test that a Gitea change is pushed to every pair sharing that source."""
+        repositories = [
+            {'gitea_repo': 'o/r', 'github_repo': 'm/one'},
+            {'gitea_repo': 'o/r', 'github_repo': 'm/two'}
+        ]
+        syncer = self._create_syncer(repositories)
+        syncer.workspace = self.test_dir
+        os.makedirs(os.path.join(self.test_dir, 'o_r'))
+        open(os.path.join(self.test_dir, 'o_r', 'HEAD'), 'w').close()
+        syncer._etag_cache = {}
+        for repo in repositories:
+            pair = f"{repo['gitea_repo']}->{repo['github_repo']}"
+            syncer._etag_cache[f'{pair}:gitea'] = {'etag': '"old"', 'body': {'name': 'r'}}
+            syncer._etag_cache[f'{pair}:github'] = {'etag': '"gh"', 'body': {'name': 'r'}}
+        
+        # Gitea has advanced to ETag "new"; GitHub is unchanged
+        def gitea_get(url, headers=None):
+            if headers.get('If-None-Match') == '"new"':
+                return MagicMock(status_code=304, headers={})
+            response = MagicMock(status_code=200, headers={'ETag': '"new"'})
+            response.json.return_value = {'name': 'r'}
+            response.content = json.dumps(response.json.return_value).encode()
+            return response
+        
+        with patch.object(syncer.gitea_session, 'get', side_effect=gitea_get), \
+             patch.object(syncer.github_session, 'get', return_value=MagicMock(status_code=304, headers={})), \
+             patch.object(syncer, '_clone_or_update_repo', return_value=True), \
+             patch.object(syncer, '_push_mirror', return_value=True) as mock_push:
+            for cycle in range(2):
+                syncer._repo_cache.clear()
+                for repo in repositories:
+                    self.assertTrue(syncer.sync_repository_code(repo))
+        
+        # Both pairs push once after the change, then both skip
+        pushed = [call.args[2] for call in mock_push.call_args_list]
+        self.assertEqual(len(pushed), 2)
+        self.assertIn('m/one', pushed[0])
+        self.assertIn('m/two', pushed[1])
+    
+    @unittest.skipIf(GitRepoSyncer is None, "GitRepoSyncer not available")
+    def test_rate_limited_request_is_retried(self):
+        """Test that a 403 carrying Retry-After is retried after waiting."""
+        syncer = self._create_syncer()
+        limited = MagicMock(status_code=403, headers={'Retry-After': '5'})
+        ok = MagicMock(status_code=200, headers={})
+        session = MagicMock()
+        session.get.side_effect = [limited, ok]
+        
+        with patch('gitea_github_sync.time.sleep') as mock_sleep:
+            response = syncer.github_limiter.get(session, 'https://api.github.com/repos/test/repo')
+        
+        self.assertIs(response, ok)
+        self.assertEqual(session.get.call_count, 2)
+        self.assertAlmostEqual(mock_sleep.call_args.args[0], 5, delta=1)
+    
+    @unittest.skipIf(GitRepoSyncer is None, "GitRepoSyncer not available")
+    def test_too_many_requests_is_retried_by_limiter(self):
+        """Test that 429 responses reach the limiter and back off exponentially."""
+        syncer = self._create_syncer()
+        adapter = syncer.github_session.get_adapter('https://api.github.com')
+        self.assertNotIn(429, adapter.max_retries.status_forcelist)
+        
+        limited = MagicMock(status_code=429, headers={})
+        ok = MagicMock(status_code=200, headers={})
+        session = MagicMock()
+        session.get.side_effect = [limited, limited, ok]
+        
+        with patch('gitea_github_sync.time.sleep') as mock_sleep:
+            response = syncer.github_limiter.get(session, 'https://api.github.com/repos/test/repo')
+        
+        self.assertIs(response, ok)
+        self.assertEqual(session.get.call_count, 3)
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        self.assertEqual(len(delays), 2)
+        self.assertAlmostEqual(delays[0], 1, delta=0.5)
+        self.assertAlmostEqual(delays[1], 2, delta=0.5)
+    
+    @unittest.skipIf(GitRepoSyncer is None, "GitRepoSyncer not available")
+    def test_sync_issues_creates_missing_open_issues(self):
+        """Test that only open issues missing on the other side are created."""
+        syncer = self._create_syncer()
+        gitea_issues = [
+            {'title': 'shared', 'state': 'open'},
+            {'title': 'gitea only', 'state': 'open'},
+            {'title': 'gitea closed', 'state': 'closed'}
+        ]
+        github_issues = [
+            {'title': 'shared', 'state': 'open'},
+            {'title': 'github only', 'state': 'open'}
+        ]
+        
+        with patch.object(syncer, '_get_gitea_issues', return_value=gitea_issues), \
+             patch.object(syncer, '_get_github_issues', return_value=github_issues), \
+             patch.object(syncer, '_create_github_issue', return_value=True) as create_github, \
+             patch.object(syncer, '_create_gitea_issue', return_value=True) as create_gitea:
+            self.assertTrue(syncer.sync_issues({
+                'gitea_repo': 'test/repo',
+                'github_repo': 'test/repo',
+                'sync_issues': True
+            }))
+        
+        create_github.assert_called_once_with('test/repo', gitea_issues[1])
+        create_gitea.assert_called_once_with('test/repo', github_issues[1])
+    
+    @unittest.skipIf(GitRepoSyncer is None, "GitRepoSyncer not available")
+    def test_shared_gitea_source_is_fetched_once(self):
+        """Test that pairs fanning out from one Gitea repo reuse its mirror."""
+        repositories = [
+            {'gitea_repo': 'test/repo', 'github_repo': 'mirror/one'},
+            {'gitea_repo': 'test/repo', 'github_repo': 'mirror/two'}
+        ]
+        syncer = self._create_syncer(repositories)
+        syncer.workspace = self.test_dir
+        
+        with patch.object(syncer, '_get_gitea_repo_info', return_value=({'name': 'repo'}, True)), \
+             patch.object(syncer, '_get_github_repo_info', return_value=({'name': 'repo'}, True)), \
+             patch.object(syncer, '_clone_or_update_repo', return_value=True) as mock_clone, \
+             patch.object(syncer, '_push_mirror', return_value=True) as mock_push, \
+             patch.object(syncer, '_commit_etags'):
+            for repo_config in repositories:
+                self.assertTrue(syncer.sync_repository_code(repo_config))
+        
+        self.assertEqual(mock_clone.call_count, 1)
+        self.assertEqual(mock_push.call_count, 2)
+    
+    @unittest.skipIf(GitRepoSyncer is None, "GitRepoSyncer not available")
+    def test_small_tmpfs_is_not_used_as_workspace(self):
+        """Test that /dev/shm is only the default workspace when it has room."""
+        syncer = self._create_syncer()
+        small = MagicMock(f_bavail=16384, f_frsize=4096)
+        large = MagicMock(f_bavail=1 << 20, f_frsize=4096)
+        
+        with patch('gitea_github_sync.os.path.isdir', return_value=True), \
+             patch('gitea_github_sync.os.access', return_value=True), \
+             patch('gitea_github_sync.os.statvfs', side_effect=[small, large]):
+            self.assertEqual(syncer._select_workspace(), './sync_workspace')
+            self.assertEqual(syncer._select_workspace(), '/dev/shm/sync_workspace')
+    
+    @unittest.skipIf(GitRepoSyncer is None, "GitRepoSyncer not available")
+    def test_push_plan_compiled_from_sync_direction(self):
+        """Test that each repository's push plan matches its sync direction."""
+        syncer = self._create_syncer([
+            {'gitea_repo': 'test/both', 'github_repo': 'test/both'},
+            {'gitea_repo': 'test/out', 'github_repo': 'test/out', 'sync_direction': 'gitea_to_github'},
+            {'gitea_repo': 'test/in', 'github_repo': 'test/in', 'sync_direction': 'github_to_gitea'}
+        ])
+        
+        remotes = [[remote for remote, _ in repo['_push_plan']] for repo in syncer.config['repositories']]
+        self.assertEqual(remotes, [['github', 'gitea'], ['github'], ['gitea']])
+    
     @unittest.skipIf(GitRepoSyncer is None, "GitRepoSyncer not available")
     def test_invalid_config_validation(self):
         """Test that invalid configuration raises appropriate errors."""
@@ -177,6 +390,173 @@ class TestGiteaGithubSync(unittest.TestCase):
         # Should raise SystemExit due to missing required fields
         with self.assertRaises(SystemExit):
             GitRepoSyncer(self.config_file)
+
+
+@unittest.skipIf(GitRepoSyncer is None or shutil.which('git') is None,
+                 "GitRepoSyncer or git not available")
+class TestMirrorGitOperations(unittest.TestCase):
+    """Test cases for git operations on sync mirrors, against real repositories."""
+    
+    def setUp(self):
+        """Set up a syncer and a real directory for the repositories."""
+        self.test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_dir, ignore_errors=True)
+        
+        config = {
+            'gitea': {
+                'url': 'https://gitea.example.com',
+                'username': 'testuser',
+                'token': 'testtoken'
+            },
+            'github': {
+                'username': 'testuser',
+                'token': 'testtoken'
+            },
+            'sync_settings': {
+                'workspace': self.test_dir
+            }
+        }
+        config_file = os.path.join(self.test_dir, 'test_config.yaml')
+        with open(config_file, 'w') as f:
+            yaml.dump(config, f)
+        
+        self.syncer = GitRepoSyncer(config_file)
+        self.addCleanup(self.syncer.close)
+    
+    def _git(self, *args, cwd=None):
+        """Run a git command for test setup and return its output."""
+        result = subprocess.run(
+            ['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args],
+            cwd=cwd, capture_output=True, text=True, check=True
+        )
+        return result.stdout
+    
+    def _create_remote(self, name, branches=()):
+        """Create a bare repository with one commit and the given extra branches."""
+        remote = os.path.join(self.test_dir, f'{name}.git')
+        self._git('init', '--bare', '-q', remote)
+        
+        work = os.path.join(self.test_dir, f'{name}-work')
+        self._git('init', '-q', work)
+        self._git('commit', '-q', '--allow-empty', '-m', 'initial', cwd=work)
+        for branch in branches:
+            self._git('branch', branch, cwd=work)
+        self._git('push', '-q', '--all', remote, cwd=work)
+        return remote
+    
+    def _branches(self, repo):
+        """List the branch names of a repository."""
+        return self._git('for-each-ref', '--format=%(refname:short)', 'refs/heads', cwd=repo).split()
+    
+    def test_branch_deleted_on_gitea_is_not_pushed_back(self):
+        """Test that mirror updates prune branches Gitea no longer has."""
+        branches = [f'b{i}' for i in range(50)]
+        gitea = self._create_remote('gitea', branches=['feat', *branches])
+        github = os.path.join(self.test_dir, 'github.git')
+        self._git('init', '--bare', '-q', github)
+        mirror = os.path.join(self.test_dir, 'mirror')
+        push_plan = GitRepoSyncer._compile_push_plan({'sync_direction': 'bidirectional'})
+        
+        self.assertTrue(self.syncer._clone_or_update_repo(gitea, mirror))
+        self.assertTrue(self.syncer._push_mirror(mirror, gitea, github, push_plan))
+        self.assertIn('feat', self._branches(github))
+        
+        self._git('branch', '-D', 'feat', cwd=gitea)
+        # Both remotes advance, so the mirror's remote-tracking refs for
+        # GitHub move as well
+        work = os.path.join(self.test_dir, 'gitea-work')
+        self._git('commit', '-q', '--allow-empty', '-m', 'update', cwd=work)
+        for remote in (gitea, github):
+            self._git('push', '-q', remote, *[f'HEAD:refs/heads/{b}' for b in branches], cwd=work)
+        
+        self.assertTrue(self.syncer._clone_or_update_repo(gitea, mirror))
+        self.assertTrue(self.syncer._push_mirror(mirror, gitea, github, push_plan))
+        self.assertNotIn('feat', self._branches(mirror))
+        self.assertNotIn('feat', self._branches(gitea))
+    
+    def test_cat_file_batch_reuses_one_process(self):
+        """Test batch object reads for found and missing objects, across calls."""
+        repo = self._create_remote('repo')
+        head = self._git('rev-parse', 'HEAD', cwd=repo).strip()
+        tree = self._git('rev-parse', 'HEAD^{tree}', cwd=repo).strip()
+        
+        commit, missing, spaced = self.syncer._git_cat_file_batch(repo, [head, '0' * 40, 'HEAD:a b'])
+        self.assertIn(f'tree {tree}'.encode(), commit)
+        self.assertTrue(commit.endswith(b'initial\n'))
+        self.assertIsNone(missing)
+        # "HEAD:a b missing" also has three words but is not an object header
+        self.assertIsNone(spaced)
+        
+        # A second call is answered by the same long-running process
+        proc, _ = self.syncer._git_procs[repo]
+        self.assertEqual(self.syncer._git_cat_file_batch(repo, ['HEAD', head]), [commit, commit])
+        self.assertIs(self.syncer._git_procs[repo][0], proc)
+        
+        self.syncer.close()
+        self.assertEqual(self.syncer._git_procs, {})
+        self.assertEqual(proc.returncode, 0)
+
+
+class TestShellSyncScript(unittest.TestCase):
+    """Test cases for the shell sync script, which has to run for real."""
+    
+    def setUp(self):
+        """Set up a real directory for the shell script to write into."""
+        self.test_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    def test_shell_script_config_creation(self):
+        """Test shell script configuration template creation."""
+        script_path = os.path.join(os.path.dirname(__file__), '..', 'scripts', 'gitea-github-sync.sh')
+        
+        if not os.path.exists(script_path):
+            self.skipTest("Shell script not available")
+        
+        # Test that the script can create a config template
+        result = subprocess.run(
+            [script_path, '--init'],
+            cwd=self.test_dir,
+            capture_output=True,
+            text=True
+        )
+        
+        # Should exit with 0 when creating config
+        self.assertEqual(result.returncode, 0)
+        
+        # Check that config file was created
+        config_file = os.path.join(self.test_dir, 'sync_config.json')
+        self.assertTrue(os.path.exists(config_file))
+        
+        # Verify config file is valid JSON
+        with open(config_file, 'r') as f:
+            config = json.load(f)
+        
+        # Check required sections exist
+        self.assertIn('gitea', config)
+        self.assertIn('github', config)
+        self.assertIn('repositories', config)
+        self.assertIn('sync_settings', config)
+    
+    def test_shell_script_help(self):
+        """Test that shell script shows help correctly."""
+        script_path = os.path.join(os.path.dirname(__file__), '..', 'scripts', 'gitea-github-sync.sh')
+        
+        if not os.path.exists(script_path):
+            self.skipTest("Shell script not available")
+        
+        # Test help flag
+        result = subprocess.run(
+            [script_path, '--help'],
+            capture_output=True,
+            text=True
+        )
+        
+        self.assertEqual(result.returncode, 0)
+        self.assertIn('Bidirectional sync script', result.stdout)
+        self.assertIn('Usage:', result.stdout)
     
     def test_scripts_are_executable(self):
         """Test that scripts have executable permissions."""